@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 from datetime import date
-from typing import Optional, Literal
+from typing import List, Optional, Literal, Tuple, TypedDict
 
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query
 
-from .schemas import NewsResponse
-from .scraper import fetch_news
+from .schemas import NewsItem, NewsResponse
+from .scraper import close_http_client, fetch_news, get_http_client
 from .sources import SUPPORTED_COUNTRIES
 
 app = FastAPI(
@@ -16,6 +20,58 @@ app = FastAPI(
 )
 
 
+@app.on_event("startup")
+async def startup() -> None:
+    get_http_client()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await close_http_client()
+
+
+# Respuestas recientes de /news por parámetros. Guarda la Task del crawl, así
+# requests idénticas concurrentes esperan el mismo crawl (single-flight) y las
+# repetidas dentro del TTL no vuelven a scrapear.
+_NEWS_CACHE: TTLCache = TTLCache(maxsize=512, ttl=30)
+
+
+class NewsQuery(TypedDict):
+    """Keyword arguments of ``fetch_news`` for one /news request."""
+
+    keyword: str
+    country: Optional[str]
+    language: Optional[str]
+    period: Optional[str]
+    date_from: Optional[date]
+    date_to: Optional[date]
+    page: int
+    page_size: int
+    backfill: bool
+
+
+def _news_cache_key(params: NewsQuery) -> bytes:
+    payload = json.dumps(params, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+async def _cached_fetch_news(params: NewsQuery) -> Tuple[List[NewsItem], List[str], int, str, List[str]]:
+    key = _news_cache_key(params)
+    task = _NEWS_CACHE.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch_news(**params))
+        _NEWS_CACHE[key] = task
+    try:
+        # shield: si este cliente corta la conexión, el crawl sigue para los demás.
+        items, warnings, total, resolved_country, feed_urls = await asyncio.shield(task)
+    except Exception:
+        if _NEWS_CACHE.get(key) is task:
+            del _NEWS_CACHE[key]
+        raise
+    # Copias para que cada respuesta sea independiente del resultado cacheado.
+    return [item.model_copy() for item in items], list(warnings), total, resolved_country, list(feed_urls)
+
+
 @app.get("/health")
 async def health() -> dict:
     return {"status": "ok", "supported_countries": SUPPORTED_COUNTRIES}
@@ -34,18 +90,27 @@ async def get_news(
     page: int = Query(1, ge=1),
     page_size: int = Query(..., ge=1, le=100, description="Total de items a devolver por página (obligatorio)"),
     debug: bool = Query(False, description="Si true, devuelve URLs de feeds en warnings"),
+    backfill_images: bool = Query(
+        True,
+        description="Si false, no espera a buscar og:image de los artículos: usa las ya cacheadas y completa el resto en segundo plano.",
+    ),
 ) -> NewsResponse:
+    params = NewsQuery(
+        keyword=q,
+        country=country,
+        language=language,
+        period=period,
+        date_from=date_from,
+        date_to=date_to,
+        page=page,
+        page_size=page_size,
+        backfill=backfill_images,
+    )
     try:
-        items, warnings, total, resolved_country, feed_urls = await fetch_news(
-            keyword=q,
-            country=country,
-            language=language,
-            period=period,
-            date_from=date_from,
-            date_to=date_to,
-            page=page,
-            page_size=page_size,
-        )
+        if debug:
+            items, warnings, total, resolved_country, feed_urls = await fetch_news(**params)
+        else:
+            items, warnings, total, resolved_country, feed_urls = await _cached_fetch_news(params)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
@@ -1,9 +1,34 @@
 from __future__ import annotations
 
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
 # Manual HTML sources deshabilitados para evitar ruido fuera de los feeds RSS
 # y acotar el scraping sólo a las fuentes pedidas.
-MANUAL_SOURCES = {}
+_MANUAL_SOURCE_URLS: Dict[str, List[str]] = {}
+
+# URLs por país, sin duplicados y en el orden original.
+MANUAL_SOURCES: Dict[str, Tuple[str, ...]] = {
+    country: tuple(dict.fromkeys(urls)) for country, urls in _MANUAL_SOURCE_URLS.items()
+}
+
+
+def _group_by_host(urls: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    grouped: Dict[str, List[str]] = {}
+    for url in urls:
+        grouped.setdefault(urlparse(url).netloc.lower(), []).append(url)
+    return {host: tuple(host_urls) for host, host_urls in grouped.items()}
+
+
+# Las mismas URLs agrupadas por host, para limitar la concurrencia por dominio.
+MANUAL_BY_HOST: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    country: _group_by_host(urls) for country, urls in MANUAL_SOURCES.items()
+}
+
+
+def manual_sources_for_country(country: str) -> Tuple[str, ...]:
+    return MANUAL_SOURCES.get(country, ())
 
 
-def manual_sources_for_country(country: str):
-    return MANUAL_SOURCES.get(country, [])
+def manual_sources_by_host(country: str) -> Dict[str, Tuple[str, ...]]:
+    return MANUAL_BY_HOST.get(country, {})
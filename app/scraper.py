@@ -1,19 +1,87 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Tuple
+import calendar
+import functools
+import time
+from datetime import datetime, timedelta, timezone, date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-import feedparser
 import httpx
-from dateutil import parser as date_parser
-from urllib.parse import quote_plus
+import numpy as np
+from email.utils import parsedate_to_datetime
+from html.entities import html5 as _HTML5_ENTITIES
+from cachetools import LRUCache, TTLCache
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import quote_plus, urlparse
 import unicodedata
 import re
 
+try:
+    # Opcional: autómata Aho-Corasick en C para buscar varias keywords en una pasada.
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
 from .schemas import NewsItem
+from .textfold import fold_latin1
 from .sources import NewsSource, sources_for_country, SUPPORTED_COUNTRIES, active_sources
-from .manual_sources import manual_sources_for_country
+from .manual_sources import manual_sources_by_host, manual_sources_for_country
+
+
+USER_AGENT = "Mozilla/5.0 (NewsScraper; +https://example.com)"
+
+# Cliente HTTP compartido: reutiliza conexiones (keep-alive + HTTP/2) entre
+# feeds, backfill de imágenes y fuentes manuales en lugar de abrir un pool
+# nuevo en cada fase.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Máximo de requests simultáneas por host: evita martillar un mismo dominio
+# (varios feeds/URLs del mismo medio) sin perder paralelismo entre hosts.
+HOST_CONCURRENCY = 4
+# Más conservador para las páginas HTML de fuentes manuales.
+MANUAL_HOST_CONCURRENCY = 2
+# Acotado: sólo hosts de feeds y fuentes manuales, pero sin crecer sin límite.
+_HOST_SEMAPHORES: LRUCache = LRUCache(maxsize=1024)
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    host = urlparse(url).netloc.lower()
+    semaphore = _HOST_SEMAPHORES.get(host)
+    if semaphore is None:
+        semaphore = _HOST_SEMAPHORES[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+    return semaphore
+
+
+async def _get(client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+    async with _host_semaphore(url):
+        return await client.get(url, **kwargs)
 
 
 COUNTRY_ALIASES: Dict[str, str] = {
@@ -53,6 +121,7 @@ COUNTRY_ALIASES: Dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_country(country: str) -> str:
     key = country.strip().lower()
     if key in COUNTRY_ALIASES:
@@ -62,9 +131,15 @@ def normalize_country(country: str) -> str:
     raise ValueError(f"Unsupported country '{country}'. Supported: {', '.join(SUPPORTED_COUNTRIES)}")
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_lang(lang: str) -> str:
+    # "es-AR" -> "es"
+    return lang.split("-")[0].lower()
+
+
 def normalize_language(lang: Optional[str], country_sources: List[NewsSource]) -> str:
     if lang:
-        return lang.split("-")[0].lower()
+        return _parse_lang(lang)
     return country_sources[0].language
 
 
@@ -84,70 +159,315 @@ def date_range_from_period(period: Optional[str]) -> Tuple[Optional[date], Optio
     raise ValueError("Period must be one of: day, week, month, year")
 
 
-def parse_entry_date(entry) -> Optional[datetime]:
-    if getattr(entry, "published_parsed", None):
-        return datetime(*entry.published_parsed[:6])
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# Campos de texto que usamos de cada item/entry (RSS 2.0, RSS 1.0 y Atom).
+_ENTRY_TEXT_FIELDS: Dict[str, str] = {
+    "title": "title",
+    _RSS1_NS + "title": "title",
+    _ATOM_NS + "title": "title",
+    "link": "link",
+    _RSS1_NS + "link": "link",
+    "description": "summary",
+    _RSS1_NS + "description": "summary",
+    _ATOM_NS + "summary": "summary",
+    "pubDate": "published",
+    _ATOM_NS + "published": "published",
+    _ATOM_NS + "updated": "updated",
+    "{http://purl.org/dc/elements/1.1/}date": "updated",
+}
+
+_FEED_XML_OPTIONS: Dict[str, Any] = dict(recover=True, huge_tree=False, resolve_entities=False, no_network=True)
+_FEED_XML_PARSER = etree.XMLParser(**_FEED_XML_OPTIONS)
+
+
+def new_feed_parser(encoding: Optional[str] = None) -> etree.XMLParser:
+    """Fresh incremental parser: ``feed()`` chunks as they arrive, then ``close()``.
+
+    ``encoding`` is the charset declared by the HTTP response, if any; like
+    ``resp.text`` it wins over the XML declaration.
+    """
+    if encoding:
+        try:
+            return etree.XMLParser(encoding=encoding, **_FEED_XML_OPTIONS)
+        except LookupError:
+            pass
+    return etree.XMLParser(**_FEED_XML_OPTIONS)
+
+
+# Con resolve_entities=False libxml2 deja las entidades HTML (&oacute;, &nbsp;)
+# como nodos sueltos y, en modo recover, pierde además las &amp;/&lt; que vengan
+# después. Antes de parsear se reescriben como referencias numéricas.
+_XML_ENTITIES = frozenset((b"amp", b"lt", b"gt", b"quot", b"apos"))
+_HTML_ENTITY_RE = re.compile(rb"&([A-Za-z][A-Za-z0-9]{1,31});")
+_MAX_ENTITY_LEN = 34
+
+
+def _entity_to_charref(match: "re.Match[bytes]") -> bytes:
+    name = match.group(1)
+    if name in _XML_ENTITIES:
+        return match.group(0)
+    chars = _HTML5_ENTITIES.get(name.decode("ascii") + ";")
+    if chars is None:
+        return match.group(0)
+    return b"".join(b"&#%d;" % ord(c) for c in chars)
+
+
+def html_entities_to_charrefs(data: bytes) -> bytes:
+    """Rewrite HTML named entities as numeric character references.
+
+    >>> html_entities_to_charrefs(b"Educaci&oacute;n &amp; m&aacute;s&nbsp;")
+    b'Educaci&#243;n &amp; m&#225;s&#160;'
+    """
+    if b"&" not in data:
+        return data
+    return _HTML_ENTITY_RE.sub(_entity_to_charref, data)
+
+
+def _split_partial_entity(data: bytes) -> Tuple[bytes, bytes]:
+    """Hold back a trailing ``&name`` cut by a chunk boundary."""
+    amp = data.rfind(b"&")
+    if amp == -1 or len(data) - amp > _MAX_ENTITY_LEN or b";" in data[amp:]:
+        return data, b""
+    return data[:amp], data[amp:]
+
+
+# Entidades HTML con nombre que sobreviven al parseo (dentro de CDATA, por
+# ejemplo). Las cinco de XML ya las resolvió libxml2 y no se tocan.
+_LEFTOVER_ENTITY_RE = re.compile(r"&([A-Za-z][A-Za-z0-9]{1,31});")
+_XML_ENTITY_NAMES = frozenset(name.decode("ascii") for name in _XML_ENTITIES)
+
+
+def _decode_leftover_entity(match: "re.Match[str]") -> str:
+    name = match.group(1)
+    if name in _XML_ENTITY_NAMES:
+        return match.group(0)
+    return _HTML5_ENTITIES.get(name + ";", match.group(0))
+
+
+def _element_text(el: Any, decode: bool = True) -> str:
+    """Joined, stripped text of ``el``; ``decode`` resolves leftover named entities.
+
+    >>> root = etree.fromstring(b"<t>AT&amp;amp;T <![CDATA[Educaci&oacute;n]]></t>")
+    >>> _element_text(root)
+    'AT&amp;T Educación'
+    """
+    text = "".join(el.itertext()).strip()
+    if decode and "&" in text:
+        return _LEFTOVER_ENTITY_RE.sub(_decode_leftover_entity, text)
+    return text
+
+
+def _parse_feed_element(el: Any) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {}
+    for child in el:
+        tag = child.tag
+        if not isinstance(tag, str):
+            # Comments / processing instructions.
+            continue
+        field = _ENTRY_TEXT_FIELDS.get(tag)
+        if field:
+            # Los links van tal cual: "&section=" no es una entidad.
+            text = _element_text(child, decode=field != "link")
+            if text and field not in entry:
+                entry[field] = text
+        elif tag == _ATOM_NS + "link":
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = href
+        elif tag == _MEDIA_NS + "content":
+            entry.setdefault("media_content", []).append({"url": child.get("url"), "type": child.get("type")})
+        elif tag == _MEDIA_NS + "thumbnail":
+            entry.setdefault("media_thumbnail", []).append({"url": child.get("url")})
+        elif tag == "enclosure":
+            entry.setdefault("enclosures", []).append({"href": child.get("url"), "type": child.get("type")})
+        elif tag == _CONTENT_ENCODED or tag == _ATOM_NS + "content":
+            entry.setdefault("content", []).append({"value": child.text or ""})
+        elif tag == "source" or tag == _ATOM_NS + "source":
+            entry["source"] = {"title": _element_text(child), "href": child.get("url")}
+    if "summary" not in entry and "content" in entry:
+        # Igual que feedparser: sin description, el contenido hace de resumen.
+        entry["summary"] = entry["content"][0]["value"]
+    return entry
+
+
+def parse_feed_bytes(content: bytes, encoding: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Parse an RSS/Atom body extracting only the fields the scraper uses.
+
+    Entries are plain dicts shaped like feedparser's (``title``, ``link``,
+    ``summary``, ``published``/``updated``, ``media_content``,
+    ``media_thumbnail``, ``enclosures``, ``content``, ``source``) so
+    ``parse_entry_date``/``parse_entry_image`` work on both. ``encoding`` is
+    the HTTP charset, see ``new_feed_parser``. Bodies that are not XML at all
+    (e.g. empty) yield no entries.
+
+    >>> body = (b"<rss><channel><item><title>Reforma de la Educaci&oacute;n p&uacute;blica</title>"
+    ...         b"<description>La universidad&nbsp;nacional &amp; la UBA</description></item></channel></rss>")
+    >>> entry = parse_feed_bytes(body)[0]
+    >>> entry["title"], entry["summary"]
+    ('Reforma de la Educación pública', 'La universidad\xa0nacional & la UBA')
+    >>> body = (b"<rss><channel><item><link>https://site.com/nota?id=5&amp;section=politica&amp;region=ar</link>"
+    ...         b"</item></channel></rss>")
+    >>> parse_feed_bytes(body)[0]["link"]
+    'https://site.com/nota?id=5&section=politica&region=ar'
+    >>> latin1 = "<rss><channel><item><title>Educación pública</title></item></channel></rss>".encode("latin-1")
+    >>> parse_feed_bytes(latin1, encoding="ISO-8859-1")[0]["title"]
+    'Educación pública'
+    """
+    parser = new_feed_parser(encoding) if encoding else _FEED_XML_PARSER
+    try:
+        root = etree.fromstring(html_entities_to_charrefs(content), parser=parser)
+    except etree.XMLSyntaxError:
+        return []
+    return parse_feed_root(root)
+
+
+def parse_feed_root(root: Any) -> List[Dict[str, Any]]:
+    if root is None:
+        return []
+    if root.tag == _ATOM_NS + "feed":
+        elements = root.iterchildren(_ATOM_NS + "entry")
+    else:
+        elements = root.iter("item", _RSS1_NS + "item")
+    return [_parse_feed_element(el) for el in elements]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_fallback(raw: str) -> Optional[datetime]:
+    # Sólo para formatos raros: dateutil adivina el formato y es lento.
+    from dateutil import parser as date_parser
+
+    try:
+        return date_parser.parse(raw)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def parse_date_string(raw: str) -> Optional[datetime]:
+    parsed: Optional[datetime]
+    try:
+        # RSS pubDate (RFC 822).
+        parsed = parsedate_to_datetime(raw)
+    except (TypeError, ValueError, IndexError):
+        try:
+            # Atom (ISO 8601).
+            parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            parsed = _parse_date_fallback(raw)
+    if parsed is None:
+        return None
+    # Naive UTC para poder comparar y ordenar fechas de distintos feeds.
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_entry_date(entry: Dict[str, Any]) -> Optional[datetime]:
+    get = entry.get
     for attr in ("published", "updated", "pubDate"):
-        raw = entry.get(attr)
+        raw = get(attr)
         if raw:
-            try:
-                return date_parser.parse(raw)
-            except (ValueError, TypeError):
-                continue
+            parsed = parse_date_string(raw)
+            if parsed:
+                return parsed
     return None
 
 
-def parse_entry_image(entry) -> Optional[str]:
+# Meta tags de imagen en orden de preferencia (el HTML se parsea con selectolax).
+_OG_IMAGE_SELECTORS: Tuple[Tuple[str, str], ...] = (
+    ("property", "og:image"),
+    ("name", "twitter:image"),
+    ("property", "og:image:secure_url"),
+)
+_OG_IMAGE_CSS = ", ".join(f'meta[{attr}="{value}" i]' for attr, value in _OG_IMAGE_SELECTORS)
+# Patrón ASCII: corre sobre los bytes de la respuesta sin decodificarla.
+_META_REFRESH_RE = re.compile(rb'http-equiv=["\']refresh["\'][^>]*url=([^"\' >]+)', re.IGNORECASE)
+_IMG_SRC_RE = re.compile(r'src=["\']([^"\']+)')
+
+
+def parse_entry_image(entry: Dict[str, Any]) -> Optional[str]:
+    get = entry.get
     # Try media:content
-    media_content = entry.get("media_content") or entry.get("media:content") or []
+    media_content = get("media_content") or get("media:content") or ()
     if isinstance(media_content, dict):
-        media_content = [media_content]
+        media_content = (media_content,)
     if media_content:
         url = media_content[0].get("url")
         if url:
             return url
     # Try media:thumbnail
-    media_thumbnail = entry.get("media_thumbnail") or entry.get("media:thumbnail") or []
+    media_thumbnail = get("media_thumbnail") or get("media:thumbnail") or ()
     if isinstance(media_thumbnail, dict):
-        media_thumbnail = [media_thumbnail]
+        media_thumbnail = (media_thumbnail,)
     if media_thumbnail:
         url = media_thumbnail[0].get("url")
         if url:
             return url
     # Enclosures
-    enclosures = entry.get("enclosures") or []
-    for enc in enclosures:
+    for enc in get("enclosures") or ():
         url = enc.get("href") or enc.get("url")
         if url:
             mime = (enc.get("type") or "").lower()
             if "image" in mime or mime.endswith(("jpg", "jpeg", "png", "webp")):
                 return url
     # Some feeds put image in content
-    content = entry.get("content") or []
+    content = get("content")
     if content and isinstance(content, list):
         for c in content:
             val = c.get("value") or ""
             if "img" in val and "src=" in val:
-                m = re.search(r'src=[\"\\\']([^\"\\\']+)', val)
+                m = _IMG_SRC_RE.search(val)
                 if m:
                     return m.group(1)
     return None
 
 
-def extract_og_image(html: str) -> Optional[str]:
-    patterns = [
-        r'<meta[^>]+property=[\'"]og:image[\'"][^>]+content=[\'"]([^\'"]+)[\'"]',
-        r'<meta[^>]+name=[\'"]twitter:image[\'"][^>]+content=[\'"]([^\'"]+)[\'"]',
-        r'<meta[^>]+property=[\'"]og:image:secure_url[\'"][^>]+content=[\'"]([^\'"]+)[\'"]',
-    ]
-    for pat in patterns:
-        m = re.search(pat, html, flags=re.IGNORECASE)
-        if m:
-            return m.group(1)
-    return None
+def extract_meta(html: bytes, encoding: str = "utf-8") -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return ``(title, description, og_image)`` from a single parse of ``html``."""
+    markup: Union[bytes, str] = html
+    if encoding.lower().replace("_", "-") not in ("utf-8", "utf8", "ascii", "us-ascii"):
+        # Lexbor asume UTF-8 con bytes: decodificar sólo para otros charsets.
+        try:
+            markup = html.decode(encoding, "replace")
+        except LookupError:
+            pass
+    tree = LexborHTMLParser(markup)
+
+    title: Optional[str] = None
+    title_node = tree.css_first("title")
+    if title_node is not None:
+        title = title_node.text(strip=True) or None
+    desc: Optional[str] = None
+    desc_node = tree.css_first('meta[name="description" i]')
+    if desc_node is not None:
+        desc = (desc_node.attributes.get("content") or "").strip() or None
+
+    image: Optional[str] = None
+    best_rank = len(_OG_IMAGE_SELECTORS)
+    for node in tree.css(_OG_IMAGE_CSS):
+        attrs = node.attributes
+        content = attrs.get("content")
+        if not content:
+            continue
+        for rank, (attr, value) in enumerate(_OG_IMAGE_SELECTORS[:best_rank]):
+            if (attrs.get(attr) or "").lower() == value:
+                image, best_rank = content, rank
+                break
+        if best_rank == 0:
+            break
+    return title, desc, image
 
 
 def normalize_text(text: str) -> str:
+    if text.isascii():
+        # NFKD no cambia texto ASCII: basta con pasar a minúsculas.
+        return text.lower()
+    folded = fold_latin1(text)
+    if folded is not None:
+        return folded
     normalized = (
         unicodedata.normalize("NFKD", text)
         .encode("ascii", "ignore")
@@ -157,41 +477,129 @@ def normalize_text(text: str) -> str:
     return normalized
 
 
+KeywordMatcher = Callable[[str], bool]
+
+
+def build_keyword_matcher(terms: Iterable[str]) -> Optional[KeywordMatcher]:
+    """Build a substring matcher for already-normalized terms.
+
+    Uses a pyahocorasick automaton when installed (one pass regardless of the
+    number of terms) and falls back to ``str.__contains__`` otherwise.
+    Returns ``None`` when there is nothing to match, meaning "no filter".
+    """
+    terms = [t for t in dict.fromkeys(terms) if t]
+    if not terms:
+        return None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+
+        def matches(text: str) -> bool:
+            for _ in automaton.iter(text):
+                return True
+            return False
+
+        return matches
+    if len(terms) == 1:
+        term = terms[0]
+        return lambda text: term in text
+    return lambda text: any(term in text for term in terms)
+
+
+# Cache por feed para GETs condicionales: feed_url -> (etag, last_modified,
+# entries parseadas, momento del último fetch). Dentro del TTL ni siquiera se
+# consulta al servidor; pasado el TTL se revalida con If-None-Match /
+# If-Modified-Since y un 304 reutiliza las entries sin volver a parsear.
+FEED_CACHE_TTL = 60.0
+FEED_CACHE_MAXSIZE = 1024
+_FEED_CACHE: Dict[str, Tuple[Optional[str], Optional[str], List[Dict[str, Any]], float]] = {}
+
+
+def _store_feed_cache(
+    feed_url: str, etag: Optional[str], last_modified: Optional[str], entries: List[Dict[str, Any]]
+) -> None:
+    # Reinsertar al final mantiene el dict ordenado por último fetch; se descarta el más viejo.
+    _FEED_CACHE.pop(feed_url, None)
+    _FEED_CACHE[feed_url] = (etag, last_modified, entries, time.monotonic())
+    if len(_FEED_CACHE) > FEED_CACHE_MAXSIZE:
+        del _FEED_CACHE[next(iter(_FEED_CACHE))]
+
+
+async def load_feed_entries(client: httpx.AsyncClient, feed_url: str) -> List[Dict[str, Any]]:
+    headers = {"Accept-Encoding": "br, gzip"}
+    cached = _FEED_CACHE.get(feed_url)
+    if cached:
+        etag, last_modified, entries, fetched_at = cached
+        if time.monotonic() - fetched_at < FEED_CACHE_TTL:
+            return entries
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    async with _host_semaphore(feed_url):
+        request = client.build_request("GET", feed_url, timeout=10, headers=headers)
+        resp = await client.send(request, stream=True)
+        try:
+            if cached and resp.status_code == 304:
+                _store_feed_cache(feed_url, etag, last_modified, entries)
+                return entries
+            resp.raise_for_status()
+            # Los chunks ya descomprimidos van directo al parser mientras llegan:
+            # no se arma el cuerpo completo ni resp.text.
+            parser = new_feed_parser(resp.charset_encoding)
+            pending = b""
+            async for chunk in resp.aiter_bytes():
+                ready, pending = _split_partial_entity(pending + chunk)
+                parser.feed(html_entities_to_charrefs(ready))
+            if pending:
+                parser.feed(html_entities_to_charrefs(pending))
+        finally:
+            await resp.aclose()
+    etag, last_modified = resp.headers.get("etag"), resp.headers.get("last-modified")
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        # Cuerpo vacío o no XML: sin entries, igual que parse_feed_bytes.
+        root = None
+    entries = parse_feed_root(root)
+    _store_feed_cache(feed_url, etag, last_modified, entries)
+    return entries
+
+
 async def fetch_feed(
-    client: httpx.AsyncClient, source: NewsSource, feed_url: str, keyword_lower: Optional[str]
-) -> Tuple[List[NewsItem], Optional[str]]:
+    client: httpx.AsyncClient, source: NewsSource, feed_url: str, matcher: Optional[KeywordMatcher]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     try:
-        resp = await client.get(
-            feed_url,
-            timeout=10,
-            follow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (NewsScraper; +https://example.com)"},
-        )
-        resp.raise_for_status()
-        parsed = feedparser.parse(resp.text)
+        entries = await load_feed_entries(client, feed_url)
     except Exception as exc:
         return [], f"{source.name} feed failed ({feed_url}): {exc}"
 
-    items: List[NewsItem] = []
-    for entry in parsed.entries:
-        published_at = parse_entry_date(entry) if hasattr(entry, "get") else None
-        summary = entry.get("summary") or entry.get("description") or ""
-        link = entry.get("link") or ""
+    # Dicts con los campos de NewsItem (ya con sus tipos finales): el modelo se
+    # construye sin validar y sólo para la página que se devuelve (ver fetch_news).
+    items: List[Dict[str, Any]] = []
+    for entry in entries:
+        get = entry.get
+        link = get("link")
         if not link:
             continue
+        entry_source = get("source")
+        source_title = (entry_source.get("title") if isinstance(entry_source, dict) else None) or source.name
+        title = get("title") or ""
+        if matcher:
+            # La mayoría de coincidencias están en el título: probar antes de
+            # normalizar el texto completo.
+            if not matcher(title.lower()):
+                summary = get("summary") or get("description") or ""
+                searchable = normalize_text(f"{title} {summary} {source_title}")
+                if not matcher(searchable):
+                    continue
+        published_at = parse_entry_date(entry)
         image = parse_entry_image(entry)
-        source_title = (
-            (entry.get("source") or {}).get("title")
-            if isinstance(entry.get("source"), dict)
-            else None
-        ) or source.name
-        if keyword_lower:
-            searchable = normalize_text(f"{entry.get('title','')} {summary} {source_title}")
-            if keyword_lower not in searchable:
-                continue
         items.append(
-            NewsItem(
-                title=entry.get("title") or "(sin título)",
+            dict(
+                title=title or "(sin título)",
                 link=link,
                 image_path=image,
                 date=published_at,
@@ -203,6 +611,22 @@ async def fetch_feed(
     return items, None
 
 
+def _top_order(keys: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` smallest ``keys``, as a stable ascending argsort would give them.
+
+    Callers pass ``~stamps`` so "smallest" means newest; ``~`` flips the order
+    without overflow and undated items (minimum int64) end up last.
+    """
+    if k >= len(keys) // 2:
+        return np.argsort(keys, kind="stable")
+    # Partición O(n) para hallar el k-ésimo valor y sort sólo de los candidatos;
+    # se toman todos los empatados con él (en orden de llegada) para que el
+    # resultado coincida con el sort completo.
+    kth = np.partition(keys, k - 1)[k - 1]
+    candidates = np.flatnonzero(keys <= kth)
+    return candidates[np.argsort(keys[candidates], kind="stable")][:k]
+
+
 async def fetch_news(
     keyword: str,
     country: Optional[str],
@@ -212,6 +636,7 @@ async def fetch_news(
     date_to: Optional[date],
     page: int,
     page_size: int,
+    backfill: bool = True,
 ) -> Tuple[List[NewsItem], List[str], int, str, List[str]]:
     normalized_country = normalize_country(country) if country else None
     if normalized_country:
@@ -222,89 +647,99 @@ async def fetch_news(
         sources = active_sources()
 
     if language:
-        lang = language.split("-")[0].lower()
+        lang = _parse_lang(language)
     elif normalized_country:
         lang = normalize_language(None, sources)
     else:
         lang = None
     warnings: List[str] = []
     feed_urls: List[str] = []
-    items: List[NewsItem] = []
+    # Items por link (filtrados por idioma y fecha): el primero que pasa los
+    # filtros gana, así el dedup sale gratis al juntar.
+    merged: Dict[str, Dict[str, Any]] = {}
 
     period_from, period_to = date_range_from_period(period)
     effective_from = date_from or period_from
     effective_to = date_to or period_to
+    # Rango como segundos epoch, fin exclusivo.
+    from_stamp = calendar.timegm(effective_from.timetuple()) if effective_from else None
+    to_stamp = calendar.timegm((effective_to + timedelta(days=1)).timetuple()) if effective_to else None
 
-    async with httpx.AsyncClient() as client:
-        tasks = []
-        keyword_lower = normalize_text(keyword)
-        for source in sources:
-            for feed_url in source.feeds:
-                tasks.append(fetch_feed(client, source, feed_url, keyword_lower))
-                feed_urls.append(f"{source.id}: {feed_url}")
-        # Google News fallback por país o global.
-        g_source = NewsSource(
-            id="google-news",
-            name="Google News",
-            country=normalized_country or "all",
-            language=lang or (language.split("-")[0].lower() if language else "es"),
-            feeds=[google_news_feed(keyword, normalized_country, language or lang)],
-            homepage="https://news.google.com",
-        )
-        tasks.append(fetch_feed(client, g_source, g_source.feeds[0], None))
-        feed_urls.append(f"{g_source.id}: {g_source.feeds[0]}")
-        results = await asyncio.gather(*tasks)
+    # Si todas las fuentes (y Google News) ya están en `lang`, el filtro por
+    # idioma no descarta nada y se omite.
+    check_lang = bool(lang) and any(source.language != lang for source in sources)
 
-    # Add manual HTML sources (non-RSS) per country.
-    manual_urls = manual_sources_for_country(normalized_country) if normalized_country else []
+    def _merge(item: Dict[str, Any]) -> None:
+        if check_lang and item["language"] != lang:
+            return
+        if from_stamp is not None or to_stamp is not None:
+            if item["date"] is None:
+                return
+            stamp = calendar.timegm(item["date"].timetuple())
+            if (from_stamp is not None and stamp < from_stamp) or (to_stamp is not None and stamp >= to_stamp):
+                return
+        merged.setdefault(item["link"], item)
+
+    client = get_http_client()
+    tasks = []
+    keyword_matcher = build_keyword_matcher([normalize_text(keyword)])
+    for source in sources:
+        for feed_url in source.feeds:
+            tasks.append(fetch_feed(client, source, feed_url, keyword_matcher))
+            feed_urls.append(f"{source.id}: {feed_url}")
+    # Google News fallback por país o global.
+    g_source = NewsSource(
+        id="google-news",
+        name="Google News",
+        country=normalized_country or "all",
+        language=lang or "es",
+        feeds=[google_news_feed(keyword, normalized_country, lang)],
+        homepage="https://news.google.com",
+    )
+    tasks.append(fetch_feed(client, g_source, g_source.feeds[0], None))
+    feed_urls.append(f"{g_source.id}: {g_source.feeds[0]}")
+
+    # Add manual HTML sources (non-RSS) per country, fetched alongside the feeds.
+    manual_urls = manual_sources_for_country(normalized_country) if normalized_country else ()
+    manual_by_host = manual_sources_by_host(normalized_country) if normalized_country else {}
     if manual_urls:
-        manual_items, manual_warnings = await fetch_manual_sources(keyword_lower, manual_urls, lang or "")
-        items.extend(manual_items)
+        results, (manual_items, manual_warnings) = await asyncio.gather(
+            asyncio.gather(*tasks),
+            fetch_manual_sources(client, keyword_matcher, manual_by_host, lang or ""),
+        )
+        for item in manual_items:
+            _merge(item)
         warnings.extend(manual_warnings)
         feed_urls.extend([f"manual: {u}" for u in manual_urls])
+    else:
+        results = await asyncio.gather(*tasks)
 
     for feed_items, err in results:
         if err:
             warnings.append(err)
-        items.extend(feed_items)
-
-    filtered: List[NewsItem] = []
-    for item in items:
-        if lang and item.language != lang:
-            continue
-        if effective_from or effective_to:
-            if not item.date:
-                continue
-            item_date = item.date.date()
-            if effective_from and item_date < effective_from:
-                continue
-            if effective_to and item_date > effective_to:
-                continue
-        filtered.append(item)
-
-    # Deduplicate by link
-    seen = set()
-    unique_items: List[NewsItem] = []
-    for item in filtered:
-        if item.link in seen:
-            continue
-        seen.add(item.link)
-        unique_items.append(item)
-
-    unique_items.sort(key=lambda x: x.date or datetime.min, reverse=True)
-    total = len(unique_items)
+        for item in feed_items:
+            _merge(item)
+    items = list(merged.values())
+
+    # Structure-of-arrays: fechas como segundos epoch int64 para ordenar de
+    # forma vectorizada (sin fecha -> NaT -> mínimo int64, quedan al final).
+    stamps = np.array([item["date"] for item in items], dtype="datetime64[s]").astype(np.int64)
+    total = len(items)
     start = (page - 1) * page_size
     end = start + page_size
-    page_items = unique_items[start:end]
-    await backfill_images(page_items)
+    page_idx = _top_order(~stamps, end)[start:end]
+    # Los valores los arma el propio scraper: model_construct evita la validación.
+    page_items = [NewsItem.model_construct(**items[i]) for i in page_idx.tolist()]
+    await backfill_images(client, page_items, wait=backfill)
     if total > end:
         warnings.append(f"Results truncated from {total} to page slice")
     return page_items, warnings, total, normalized_country or "all", feed_urls
 
 
+@functools.lru_cache(maxsize=1024)
 def google_news_feed(keyword: str, country: Optional[str], language: Optional[str]) -> str:
     # Google News RSS supports hl (language), gl (country), ceid (country:lang)
-    lang = (language or "es").split("-")[0].lower()
+    lang = _parse_lang(language or "es")
     if country:
         gl = country.split("-")[-1].upper()
         ceid = f"{gl}:{lang}"
@@ -315,124 +750,122 @@ def google_news_feed(keyword: str, country: Optional[str], language: Optional[st
     return f"https://news.google.com/rss/search?q={q}&hl={lang}&gl={gl}&ceid={ceid}"
 
 
-async def backfill_images(items: List[NewsItem]) -> None:
-    async with httpx.AsyncClient() as client:
-        tasks = []
-        for item in items:
-            if item.image_path and "googleusercontent.com" not in item.image_path:
-                continue
-            # Try to upgrade images that are google proxy or missing.
-            item.image_path = None
-            tasks.append(fetch_og_image(client, item))
-        if tasks:
-            await asyncio.gather(*tasks)
+# og:image ya buscadas por link (None = se buscó y no hay imagen usable).
+_IMAGE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_MISSING = object()
+# Referencias a las tareas en segundo plano para que no las recolecte el GC.
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
 
 
-async def fetch_og_image(client: httpx.AsyncClient, item: NewsItem) -> None:
-    try:
-        # If link is a Google News redirect, resolve first to get final URL.
-        target_url = item.link
-        if "news.google.com" in target_url:
-            try:
-                resp0 = await client.get(
-                    target_url,
-                    timeout=6,
-                    follow_redirects=True,
-                    headers={"User-Agent": "Mozilla/5.0 (NewsScraper; +https://example.com)"},
-                )
-                target_url = str(resp0.url)
-            except Exception:
-                target_url = item.link
-
-        resp = await client.get(
-            target_url,
-            timeout=6,
-            follow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (NewsScraper; +https://example.com)"},
-        )
-        resp.raise_for_status()
-        image = extract_og_image(resp.text)
-        if image and "googleusercontent.com" in image:
-            image = None
-        if not image:
-            # Detect meta refresh redirect
-            m = re.search(r'http-equiv=["\\\']refresh["\\\'][^>]*url=([^"\\\' >]+)', resp.text, flags=re.IGNORECASE)
-            if m:
-                try:
-                    redirect_url = m.group(1)
-                    resp2 = await client.get(
-                        redirect_url,
-                        timeout=6,
-                        follow_redirects=True,
-                        headers={"User-Agent": "Mozilla/5.0 (NewsScraper; +https://example.com)"},
-                    )
-                    resp2.raise_for_status()
-                    image = extract_og_image(resp2.text)
-                    if image and "googleusercontent.com" in image:
-                        image = None
-                    if image:
-                        item.image_path = image
-                        return
-                except Exception:
-                    pass
-        if image:
+async def backfill_images(client: httpx.AsyncClient, items: List[NewsItem], wait: bool = True) -> None:
+    """Fill missing/Google-proxy images from the og:image of each article.
+
+    Cached links are filled without network. With ``wait=False`` the rest are
+    fetched in a background task that only warms the cache for later requests.
+    """
+    missing: List[NewsItem] = []
+    for item in items:
+        if item.image_path and "googleusercontent.com" not in item.image_path:
+            continue
+        # Try to upgrade images that are google proxy or missing.
+        cached = _IMAGE_CACHE.get(item.link, _MISSING)
+        if cached is _MISSING:
+            missing.append(item)
+        else:
+            item.image_path = cached
+    if not missing:
+        return
+    if wait:
+        images = await _fill_image_cache(client, [item.link for item in missing])
+        for item, image in zip(missing, images):
             item.image_path = image
-            return
-    except Exception:
         return
+    task = asyncio.create_task(_fill_image_cache(client, [item.link for item in missing]))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+async def _fill_image_cache(client: httpx.AsyncClient, links: List[str]) -> List[Optional[str]]:
+    results = await asyncio.gather(*[_fetch_og_image(client, link) for link in links], return_exceptions=True)
+    images: List[Optional[str]] = []
+    for link, result in zip(links, results):
+        if isinstance(result, BaseException):
+            # Error de red/HTTP: no se cachea, el próximo request reintenta.
+            images.append(None)
+            continue
+        _IMAGE_CACHE[link] = result
+        images.append(result)
+    return images
+
+
+async def _fetch_og_image(client: httpx.AsyncClient, link: str) -> Optional[str]:
+    """og:image of the article at ``link``; network/HTTP errors propagate."""
+    # Google News redirects are followed by the client, so the final
+    # article comes back in this same response.
+    # Sin el límite por host: todos los items de Google News comparten host
+    # y el slot quedaría tomado mientras se siguen los redirects.
+    resp = await client.get(link, timeout=6)
+    resp.raise_for_status()
+    _, _, image = extract_meta(resp.content, resp.charset_encoding or "utf-8")
+    if image and "googleusercontent.com" in image:
+        image = None
+    if not image:
+        # Detect meta refresh redirect
+        m = _META_REFRESH_RE.search(resp.content)
+        if m:
+            redirect_url = m.group(1).decode("utf-8", "replace")
+            resp2 = await client.get(redirect_url, timeout=6)
+            resp2.raise_for_status()
+            _, _, image = extract_meta(resp2.content, resp2.charset_encoding or "utf-8")
+            if image and "googleusercontent.com" in image:
+                image = None
+    return image
+
+
+async def fetch_manual_sources(
+    client: httpx.AsyncClient,
+    matcher: Optional[KeywordMatcher],
+    urls_by_host: Dict[str, Tuple[str, ...]],
+    language: str,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    async def _fetch_one(url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            resp = await _get(client, url, timeout=8)
+            resp.raise_for_status()
+            title, desc, image = extract_meta(resp.content, resp.charset_encoding or "utf-8")
+            title = title or url
+            searchable = normalize_text(f"{title} {desc or ''}")
+            if matcher and not matcher(searchable):
+                return None, None
+            if image and "googleusercontent.com" in image:
+                image = None
+            return (
+                dict(
+                    title=title,
+                    image_path=image,
+                    source=url.split("/")[2],
+                    link=url,
+                    date=None,
+                    country="",
+                    language=language,
+                ),
+                None,
+            )
+        except Exception as exc:
+            return None, f"Manual source failed ({url}): {exc}"
 
+    async def _fetch_host(host_urls: Tuple[str, ...]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        limit = asyncio.Semaphore(MANUAL_HOST_CONCURRENCY)
 
-async def fetch_manual_sources(keyword_lower: str, urls: List[str], language: str) -> Tuple[List[NewsItem], List[str]]:
-    items: List[NewsItem] = []
-    warnings: List[str] = []
-    async with httpx.AsyncClient() as client:
-        for url in urls:
-            try:
-                resp = await client.get(
-                    url,
-                    timeout=8,
-                    follow_redirects=True,
-                    headers={"User-Agent": "Mozilla/5.0 (NewsScraper; +https://example.com)"},
-                )
-                resp.raise_for_status()
-                html = resp.text
-                title = extract_title(html) or url
-                desc = extract_description(html) or ""
-                searchable = normalize_text(f"{title} {desc}")
-                if keyword_lower not in searchable:
-                    continue
-                image = extract_og_image(html)
-                if image and "googleusercontent.com" in image:
-                    image = None
-                items.append(
-                    NewsItem(
-                        title=title,
-                        image_path=image,
-                        source=url.split("/")[2],
-                        link=url,
-                        date=None,
-                        country="",
-                        language=language,
-                    )
-                )
-            except Exception as exc:
-                warnings.append(f"Manual source failed ({url}): {exc}")
-    return items, warnings
-
-
-def extract_title(html: str) -> Optional[str]:
-    m = re.search(r"<title>([^<]+)</title>", html, flags=re.IGNORECASE)
-    if m:
-        return m.group(1).strip()
-    return None
+        async def _bounded(url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+            async with limit:
+                return await _fetch_one(url)
 
+        return await asyncio.gather(*[_bounded(url) for url in host_urls])
 
-def extract_description(html: str) -> Optional[str]:
-    m = re.search(
-        r'<meta[^>]+name=["\\\']description["\\\'][^>]+content=["\\\']([^"\\\']+)["\\\']',
-        html,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        return m.group(1).strip()
-    return None
+    # Hosts en paralelo, a lo sumo MANUAL_HOST_CONCURRENCY requests por host.
+    per_host = await asyncio.gather(*[_fetch_host(host_urls) for host_urls in urls_by_host.values()])
+    results = [result for host_results in per_host for result in host_results]
+    items = [item for item, _ in results if item is not None]
+    warnings = [warning for _, warning in results if warning]
+    return items, warnings
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Set
 
 
 @dataclass(frozen=True)
@@ -686,8 +686,7 @@ def sources_for_country(country: str) -> List[NewsSource]:
 
 
 # Disable feeds that are returning consistent 404/403 to reduce noise.
-DISABLED_SOURCE_IDS = {
-}
+DISABLED_SOURCE_IDS: Set[str] = set()
 
 
 def active_sources() -> List[NewsSource]:
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+# Plegado ASCII + minúsculas de texto Latin-1 para normalize_text. Vive fuera de
+# scraper.py porque el kernel lo compila numba (necesita bytecode Python) y
+# scraper.py puede compilarse con mypyc.
+
+import unicodedata
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    # Opcional: compila a código máquina el kernel de plegado.
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None  # type: ignore[assignment]
+
+
+def _build_ascii_fold_table() -> Tuple[np.ndarray, np.ndarray]:
+    # Resultado de normalize_text para cada code point Latin-1 (0..255): la
+    # mayoría da 0 o 1 byte ASCII, unos pocos más ("¼" -> "14").
+    folded = [
+        unicodedata.normalize("NFKD", chr(cp)).encode("ascii", "ignore").lower() for cp in range(256)
+    ]
+    width = max(len(out) for out in folded)
+    table = np.zeros((256, width), dtype=np.uint8)
+    lengths = np.zeros(256, dtype=np.uint8)
+    for cp, out in enumerate(folded):
+        table[cp, : len(out)] = np.frombuffer(out, dtype=np.uint8)
+        lengths[cp] = len(out)
+    return table, lengths
+
+
+_FOLD_TABLE, _FOLD_LENGTHS = _build_ascii_fold_table()
+
+
+def _fold_ascii_lower(buf: np.ndarray, table: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    out = np.empty(buf.shape[0] * table.shape[1], dtype=np.uint8)
+    n = 0
+    for i in range(buf.shape[0]):
+        b = buf[i]
+        for k in range(lengths[b]):
+            out[n] = table[b, k]
+            n += 1
+    return out[:n]
+
+
+if numba is not None:
+    _fold_ascii_lower = numba.njit(cache=True, nogil=True)(_fold_ascii_lower)
+    # Compilar al importar y no en la primera request.
+    _fold_ascii_lower(np.frombuffer(b"\xc1", dtype=np.uint8), _FOLD_TABLE, _FOLD_LENGTHS)
+
+
+def fold_latin1(text: str) -> Optional[str]:
+    """NFKD/ASCII/lower fold of ``text`` via the JIT kernel.
+
+    Returns ``None`` when numba is not installed or ``text`` is not Latin-1,
+    so the caller can fall back to ``unicodedata``.
+    """
+    if numba is None:
+        return None
+    try:
+        buf = np.frombuffer(text.encode("latin-1"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        # Fuera de Latin-1 (comillas tipográficas, etc.).
+        return None
+    return _fold_ascii_lower(buf, _FOLD_TABLE, _FOLD_LENGTHS).tobytes().decode("ascii")
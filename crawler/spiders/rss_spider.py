@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Iterable
 
 import scrapy
-import feedparser
+from w3lib.encoding import http_content_type_encoding
 
 # Ensure project root is importable to reuse source definitions and helpers.
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -13,7 +13,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from app.sources import SOURCES  # noqa: E402
-from app.scraper import parse_entry_date, parse_entry_image  # noqa: E402
+from app.scraper import parse_entry_date, parse_entry_image, parse_feed_bytes  # noqa: E402
 from crawler.items import NewsItem  # noqa: E402
 
 
@@ -28,8 +28,8 @@ class RssAllSpider(scrapy.Spider):
 
     def parse(self, response):
         source = response.meta["source"]
-        parsed = feedparser.parse(response.text)
-        for entry in parsed.entries:
+        content_type = response.headers.get("Content-Type", b"").decode("latin-1")
+        for entry in parse_feed_bytes(response.body, http_content_type_encoding(content_type)):
             link = entry.get("link") or ""
             if not link:
                 continue
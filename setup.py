@@ -0,0 +1,24 @@
+"""Packaging opcional para compilar app/scraper.py con mypyc.
+
+    pip install mypy
+    SCRAPER_MYPYC=1 python setup.py build_ext --inplace
+
+Genera el .so junto a app/scraper.py; sin SCRAPER_MYPYC se usa el módulo Python.
+"""
+import os
+
+from setuptools import find_packages, setup
+
+ext_modules = []
+if os.environ.get("SCRAPER_MYPYC"):
+    from mypyc.build import mypycify
+
+    # textfold.py queda interpretado: numba necesita su bytecode.
+    ext_modules = mypycify(["--ignore-missing-imports", "app/scraper.py"], opt_level="3")
+
+setup(
+    name="scraping-news-api",
+    version="0.1.0",
+    packages=find_packages(include=["app", "crawler", "crawler.*"]),
+    ext_modules=ext_modules,
+)